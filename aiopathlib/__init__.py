@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import sys
 from collections.abc import Generator
 from pathlib import Path, PosixPath, PurePath, WindowsPath
 from stat import S_ISBLK, S_ISCHR, S_ISDIR, S_ISFIFO, S_ISLNK, S_ISREG, S_ISSOCK
+from types import TracebackType
 from typing import TYPE_CHECKING, TypeAlias
 
 import aiofiles
@@ -47,7 +49,13 @@ else:
         return orjson.loads(data, **kw)
 
 
+_listdir = aiofiles.os.wrap(os.listdir)
+
+
 class AsyncPath(Path):
+    # No instance __dict__, so that listing results are as compact as Path objects
+    __slots__ = ()
+
     def __new__(cls, *args, **kwargs):
         if cls is AsyncPath:
             cls = AsyncWindowsPath if os.name == "nt" else AsyncPosixPath
@@ -286,6 +294,68 @@ class AsyncPath(Path):
         abspath = await aiofiles.ospath.abspath(str(self))
         return self.__class__(abspath)
 
+    def appender(
+        self,
+        flush_interval: float | None = 1.0,
+        max_buffer: int = 64 * 1024,
+        fsync: bool = False,
+        encoding: str | None = None,
+        errors: str | None = None,
+        *,
+        loop=None,
+        executor=None,
+    ) -> AsyncAppender:
+        """
+        Return a long-lived buffered writer that appends to this file.
+
+        Records written by any number of coroutines are batched and written
+        with one ``writev`` per flush (and one ``fsync`` per batch if `fsync`
+        is true). Use it as ``async with path.appender() as fp: ...`` or call
+        ``await fp.close()`` to drain the buffer when done. Text records are
+        encoded with `encoding`, which defaults to UTF-8 (not the locale
+        encoding used by `write_text`).
+        """
+        return AsyncAppender(
+            self,
+            flush_interval=flush_interval,
+            max_buffer=max_buffer,
+            fsync=fsync,
+            encoding=encoding,
+            errors=errors,
+            loop=loop,
+            executor=executor,
+        )
+
+    if sys.version_info >= (3, 13):
+
+        def _make_child_relpath(self, name: str) -> Self:
+            # Join a single child name that is known to be clean (e.g. from
+            # os.listdir) without re-parsing the whole path string.
+            path_str = str(self)
+            if self.name:
+                path_str = f"{path_str}{self.parser.sep}{name}"
+            elif path_str != ".":
+                path_str = f"{path_str}{name}"
+            else:
+                path_str = name
+            path = self._from_parsed_string(path_str)  # type:ignore[attr-defined]
+            # Fill in the parsed parts as well, so `name`, `parent`, `parts`...
+            # of the child never parse the string again
+            path._drv = self.drive
+            path._root = self.root
+            path._tail_cached = [*self._tail, name]  # type:ignore[attr-defined]
+            return path
+
+    async def listdir(self, *, loop=None, executor=None) -> list[Self]:
+        """
+        Return the paths of the directory contents, like `iterdir` but the
+        directory is read in a thread. Child paths are built from the already
+        parsed parent instead of parsing each of them from a string.
+        """
+        names = await _listdir(self, loop=loop, executor=executor)
+        make_child = self._make_child_relpath  # type:ignore[attr-defined]
+        return [make_child(name) for name in names]
+
     def glob(self, pattern: str) -> Generator[Path, None, None]:
         return Path(self).glob(pattern)
 
@@ -299,9 +369,198 @@ class AsyncPosixPath(AsyncPath, PosixPath):
     On a POSIX system, instantiating a AsyncPath should return this object.
     """
 
+    __slots__ = ()
+
 
 class AsyncWindowsPath(AsyncPath, WindowsPath):
     """AsyncPath subclass for Windows systems.
 
     On a Windows system, instantiating a AsyncPath should return this object.
     """
+
+    __slots__ = ()
+
+
+_IOV_MAX = 1024
+
+
+def _write_all(fd: int, chunks: list[bytes]) -> None:
+    """Write all chunks to fd, using writev when available and retrying on
+    partial writes."""
+    writev = getattr(os, "writev", None)
+    views = [memoryview(c) for c in chunks if c]
+    while views:
+        n = os.write(fd, views[0]) if writev is None else writev(fd, views[:_IOV_MAX])
+        i = 0
+        while i < len(views) and n >= len(views[i]):
+            n -= len(views[i])
+            i += 1
+        del views[:i]
+        if n:
+            views[0] = views[0][n:]
+
+
+class AsyncAppender:
+    """Buffered appender that group-commits writes from many coroutines.
+
+    Created by :meth:`AsyncPath.appender`. ``write`` only blocks when the
+    buffer holds `max_buffer` bytes or more, in which case the caller waits
+    for the pending batch to be flushed (backpressure). A background task
+    flushes every `flush_interval` seconds (which must be positive); pass
+    ``None`` to flush only when the buffer is full or on ``flush``/``close``.
+    """
+
+    def __init__(
+        self,
+        path: str | PurePath,
+        flush_interval: float | None = 1.0,
+        max_buffer: int = 64 * 1024,
+        fsync: bool = False,
+        encoding: str | None = None,
+        errors: str | None = None,
+        *,
+        loop=None,
+        executor=None,
+    ) -> None:
+        if max_buffer <= 0:
+            raise ValueError(f"max_buffer must be positive, got {max_buffer!r}")
+        if flush_interval is not None and flush_interval <= 0:
+            raise ValueError(
+                f"flush_interval must be positive or None, got {flush_interval!r}"
+            )
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.fsync = fsync
+        self.encoding = encoding or "utf-8"
+        self.errors = errors or "strict"
+        self._loop = loop
+        self._executor = executor
+        self._fd: int | None = None
+        self._buffer: list[bytes] = []
+        self._size = 0
+        self._lock = asyncio.Lock()
+        self._timer: asyncio.Task | None = None
+        self._inflight: asyncio.Future | None = None
+        self._error: BaseException | None = None
+        self._closed = False
+        self._closing: asyncio.Future | None = None
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    def _check(self) -> None:
+        if self._closed:
+            raise ValueError("I/O operation on closed appender.")
+        if self._error is not None:
+            raise self._error
+
+    async def _run(self, func, *args):
+        loop = self._loop or asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def write(self, data: bytes | str) -> int:
+        """Buffer data to be appended, waiting for a flush if the buffer is
+        full. Return the number of bytes/characters buffered."""
+        self._check()
+        size = len(data)
+        if isinstance(data, str):
+            data = data.encode(self.encoding, self.errors)
+        self._buffer.append(data)
+        self._size += len(data)
+        if self._size >= self.max_buffer:
+            await self.flush()
+        elif self._timer is None and self.flush_interval is not None:
+            self._timer = asyncio.ensure_future(self._flush_periodically())
+        return size
+
+    async def _flush_periodically(self) -> None:
+        # Exit once the buffer is drained, the next ``write`` starts a new timer
+        try:
+            while self._buffer:
+                await asyncio.sleep(self.flush_interval or 0)
+                try:
+                    await self._flush()
+                except Exception:
+                    # Saved in self._error and re-raised to the next caller
+                    return
+        finally:
+            self._timer = None
+
+    def _commit(self, chunks: list[bytes]) -> None:
+        if self._fd is None:
+            flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+            self._fd = os.open(self.path, flags | getattr(os, "O_BINARY", 0), 0o666)
+        _write_all(self._fd, chunks)
+        if self.fsync:
+            os.fsync(self._fd)
+
+    async def _flush(self) -> None:
+        async with self._lock:
+            if self._inflight is not None:
+                # A previous flush was cancelled while its batch was still being
+                # written in the executor, wait for it to keep appends ordered.
+                inflight, self._inflight = self._inflight, None
+                await asyncio.wait([inflight])
+                if self._error is None and inflight.exception() is not None:
+                    self._error = inflight.exception()
+            if self._error is not None:
+                raise self._error
+            if not self._buffer:
+                return
+            chunks, self._buffer, self._size = self._buffer, [], 0
+            loop = self._loop or asyncio.get_running_loop()
+            fut = loop.run_in_executor(self._executor, self._commit, chunks)
+            self._inflight = fut
+            try:
+                await asyncio.shield(fut)
+            except Exception as e:
+                self._error = e
+                raise
+            self._inflight = None
+
+    async def flush(self) -> None:
+        """Write out everything buffered so far as one batch."""
+        self._check()
+        await self._flush()
+
+    async def _drain(self) -> None:
+        try:
+            await self._flush()
+        finally:
+            if self._inflight is not None:
+                await asyncio.wait([self._inflight])
+            if self._fd is not None:
+                fd, self._fd = self._fd, None
+                await self._run(os.close, fd)
+
+    async def close(self) -> None:
+        """Drain the buffer and close the underlying file.
+
+        If ``close`` is cancelled, the pending batch is still written and the
+        file closed in the background.
+        """
+        if self._closing is None:
+            self._closed = True
+            timer = self._timer
+            if timer is not None:
+                async with self._lock:
+                    # Never interrupt the timer in the middle of a flush
+                    timer.cancel()
+                await asyncio.wait([timer])
+            self._closing = asyncio.ensure_future(self._drain())
+            # Errors are saved in self._error, don't log them if nobody waits
+            self._closing.add_done_callback(lambda f: f.cancelled() or f.exception())
+        await asyncio.shield(self._closing)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""
+Micro-benchmark of building AsyncPath objects for directory listing results.
+
+Compare `parent / name` (parse every child from a string) with
+`parent._make_child_relpath(name)` (used by `AsyncPath.listdir`), and the
+memory of instances with and without `__slots__`.
+
+Usage::
+    python scripts/bench_construction.py [count]
+
+"""
+
+import sys
+import timeit
+import tracemalloc
+from functools import partial
+
+from aiopathlib import AsyncPath
+
+
+class DictPath(type(AsyncPath())):  # type:ignore[misc]
+    """Same as AsyncPath, but keeps a per-instance __dict__ like before"""
+
+
+def build(parent, names) -> list:
+    return [parent / name for name in names]
+
+
+def build_fast(parent, names) -> list:
+    make_child = parent._make_child_relpath
+    return [make_child(name) for name in names]
+
+
+def materialize(func, parent, names) -> list:
+    # Listing results are normally formatted and filtered by name/suffix, so read
+    # both the string and the parsed parts of each path
+    paths = func(parent, names)
+    for p in paths:
+        str(p)
+        p.name  # noqa: B018
+        p.suffix  # noqa: B018
+    return paths
+
+
+def measure_memory(func, parent, names) -> int:
+    tracemalloc.start()
+    paths = materialize(func, parent, names)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del paths
+    return size
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if sys.argv[1:] else 100_000
+    names = [f"file-{i}.log" for i in range(count)]
+    cases = {
+        "parent / name": (build, DictPath("/var/log/app")),
+        "_make_child_relpath": (build_fast, DictPath("/var/log/app")),
+        "_make_child_relpath + __slots__": (build_fast, AsyncPath("/var/log/app")),
+    }
+    print(f"Python {sys.version.split()[0]}, {count} paths")
+    for label, (func, parent) in cases.items():
+        seconds = min(
+            timeit.repeat(partial(materialize, func, parent, names), number=1)
+        )
+        size = measure_memory(func, parent, names)
+        print(
+            f"{label:<32} {seconds * 1e9 / count:8.0f} ns/path"
+            f" {size / count:8.0f} bytes/path"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,11 @@
 """Tests for asyncio's os module."""
 
+import asyncio
 import contextlib
 import json
 import os
+import sys
+import threading
 from os.path import dirname, exists, isdir, join
 from pathlib import Path
 
@@ -195,3 +198,169 @@ async def test_json():
     await p.write_json(data)
     assert (await p.read_text()) == text
     assert (await p.read_json()) == data
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("tmp_work_dir")
+async def test_appender():
+    p = AsyncPath("audit.log")
+    await p.write_text("head\n")
+    async with p.appender(flush_interval=None, fsync=True) as fp:
+        await asyncio.gather(*(fp.write(f"{i}\n") for i in range(100)))
+        assert await p.read_text() == "head\n"
+        await fp.flush()
+        assert len((await p.read_text()).splitlines()) == 101
+        assert await fp.write(b"bytes\n") == 6
+    assert fp.closed
+    lines = (await p.read_text()).splitlines()
+    assert lines[0] == "head" and lines[-1] == "bytes"
+    assert sorted(lines[1:-1], key=int) == [str(i) for i in range(100)]
+    with pytest.raises(ValueError):
+        await fp.write("closed")
+    await fp.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("tmp_work_dir")
+async def test_appender_backpressure_and_interval():
+    p = AsyncPath("small.log")
+    fp = p.appender(flush_interval=None, max_buffer=10)
+    await fp.write(b"12345")
+    assert not await p.exists()
+    await fp.write(b"67890")  # buffer is full, wait for it to be flushed
+    assert await p.read_bytes() == b"1234567890"
+    await fp.close()
+
+    fp = p.appender(flush_interval=0.01)
+    await fp.write(b"x")
+    assert fp._timer is not None
+
+    async def timer_done() -> None:
+        while fp._timer is not None:
+            await asyncio.sleep(0.005)
+
+    # The timer flushes the buffer then stops, as there is nothing left to flush
+    await asyncio.wait_for(timer_done(), timeout=5)
+    assert await p.read_bytes() == b"1234567890x"
+    await fp.write(b"y")
+    assert fp._timer is not None
+    await asyncio.wait_for(timer_done(), timeout=5)
+    assert await p.read_bytes() == b"1234567890xy"
+    await fp.close()
+    with pytest.raises(ValueError):
+        p.appender(max_buffer=0)
+    with pytest.raises(ValueError):
+        p.appender(flush_interval=0)
+
+
+@pytest.mark.asyncio
+async def test_appender_error(tmp_work_dir: Path):
+    fp = AsyncPath(tmp_work_dir).appender(flush_interval=None)
+    await fp.write("to a directory")
+    with pytest.raises(IsADirectoryError):
+        await fp.flush()
+    with pytest.raises(IsADirectoryError):
+        await fp.write("again")
+    with pytest.raises(IsADirectoryError):
+        await fp.close()
+    assert fp.closed
+
+    fp = AsyncPath(tmp_work_dir).appender(flush_interval=0.01)
+    await fp.write("flushed by timer")
+
+    async def timer_done() -> None:
+        while fp._timer is not None:
+            await asyncio.sleep(0.005)
+
+    await asyncio.wait_for(timer_done(), timeout=5)
+    with pytest.raises(IsADirectoryError):
+        await fp.write("again")
+    with pytest.raises(IsADirectoryError):
+        await fp.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("tmp_work_dir")
+async def test_appender_cancelled_flush(monkeypatch):
+    started, release = threading.Event(), threading.Event()
+    fsync = os.fsync
+
+    def slow_fsync(fd: int) -> None:
+        started.set()
+        release.wait(5)
+        fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", slow_fsync)
+    p = AsyncPath("cancel.log")
+    fp = p.appender(flush_interval=None, fsync=True)
+    await fp.write("1\n")
+    task = asyncio.ensure_future(fp.flush())
+    while not started.is_set():
+        await asyncio.sleep(0.005)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    # The first batch is still being written, the next one has to wait for it
+    await fp.write("2\n")
+    task = asyncio.ensure_future(fp.flush())
+    await asyncio.sleep(0.01)
+    assert not task.done()
+    release.set()
+    await asyncio.wait_for(task, timeout=5)
+    await fp.close()
+    assert await p.read_text() == "1\n2\n"
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("tmp_work_dir")
+async def test_appender_cancelled_close(monkeypatch):
+    started, release = threading.Event(), threading.Event()
+    fsync = os.fsync
+    synced = []
+
+    def slow_fsync(fd: int) -> None:
+        started.set()
+        release.wait(5)
+        synced.append(os.fstat(fd).st_ino)
+        fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", slow_fsync)
+    p = AsyncPath("cancel.log")
+    fp = p.appender(flush_interval=None, fsync=True)
+    await fp.write("1\n")
+    task = asyncio.ensure_future(fp.close())
+    while not started.is_set():
+        await asyncio.sleep(0.005)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    # The file is not closed under the batch that is still being written
+    assert fp._fd is not None
+    with pytest.raises(ValueError):
+        await fp.write("closed")
+    # Would reuse the fd number of the appender if it had been closed
+    other_fd = os.open("other.log", os.O_WRONLY | os.O_CREAT)
+    release.set()
+    await asyncio.wait_for(fp.close(), timeout=5)
+    os.close(other_fd)
+    assert fp._fd is None
+    assert synced == [(await p.stat()).st_ino]
+    assert await p.read_text() == "1\n"
+
+
+@pytest.mark.asyncio
+async def test_listdir():
+    for ap in (AsyncPath(__file__).parent, AsyncPath(), AsyncPath("/")):
+        children = await ap.listdir()
+        for child in children:
+            # Parsed parts are set when the child is created, not parsed later
+            fresh = Path(str(child))
+            if sys.version_info >= (3, 12):
+                assert child._tail_cached == fresh._tail  # type:ignore[attr-defined]
+            else:
+                assert child._parts == fresh._parts  # type:ignore[attr-defined]
+            assert (child.drive, child.root) == (fresh.drive, fresh.root)
+        assert sorted(children) == sorted(Path(ap).iterdir())
+        assert sorted(map(str, children)) == sorted(map(str, Path(ap).iterdir()))
+        assert all(isinstance(p, AsyncPath) for p in children)
+    assert not hasattr(children[0], "__dict__")